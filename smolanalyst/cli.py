@@ -9,13 +9,15 @@ management (Docker or Podman), and task execution.
 """
 
 import os
+import sys
 import json
 import shutil
 import tempfile
-import datetime
 import subprocess
 from pathlib import Path
-from typing import TypedDict, List, Optional
+from functools import lru_cache
+from dataclasses import asdict, dataclass, fields
+from typing import List, Optional
 
 # Third-party imports
 import typer
@@ -31,7 +33,7 @@ from smolanalyst.constants import (
     SOURCE_FILES_DIR,
 )
 
-from smolanalyst.filesystem import copy_from_source
+from smolanalyst.filesystem import check_files, copy_from_source
 
 # Application constants
 IMAGE_NAME = f"{ENV_NAME}:{ENV_VERSION}"
@@ -49,8 +51,9 @@ conf_app = typer.Typer(help="Configuration management")
 app.add_typer(conf_app, name="conf")
 
 
-class ModelConfig(TypedDict):
-    """Type definition for model configuration data."""
+@dataclass(frozen=True, slots=True)
+class ModelConfig:
+    """Model configuration data."""
 
     type: str  # Model type (hfapi|litellm)
     model_id: str  # Model identifier
@@ -58,80 +61,144 @@ class ModelConfig(TypedDict):
     api_base: str  # Base URL for API requests
 
 
+# Keys read from the configuration file, in ModelConfig field order
+CONFIG_KEYS = tuple(field.name for field in fields(ModelConfig))
+
+
 class ContainerEngineNotFoundError(Exception):
     """Exception raised when a required container engine is not found."""
 
     pass
 
 
+@lru_cache(maxsize=1)
+def _load_config(mtime_ns: int) -> ModelConfig:
+    """
+    Parse the configuration file, memoized on its modification time.
+
+    Args:
+        mtime_ns (int): Modification time of the file, so a rewrite invalidates the cache.
+
+    Returns:
+        ModelConfig: The loaded configuration.
+
+    Raises:
+        KeyError: If required configuration keys are missing.
+    """
+    with open(CONFIG_FILE, "r") as f:
+        config = json.load(f)
+
+    missing = [key for key in CONFIG_KEYS if key not in config]
+    if missing:
+        raise KeyError(f"Missing configuration keys: {', '.join(missing)}")
+
+    return ModelConfig(**{key: config[key] for key in CONFIG_KEYS})
+
+
 def read_config() -> ModelConfig:
     """
     Read and parse the configuration file.
 
+    The file is only parsed again when its modification time changes.
+
     Returns:
         ModelConfig: The loaded configuration.
 
     Raises:
         FileNotFoundError: If the configuration file doesn't exist.
         json.JSONDecodeError: If the configuration file is invalid JSON.
+        KeyError: If required configuration keys are missing.
     """
-    if not CONFIG_FILE.exists():
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found ({CONFIG_FILE})")
 
-    with open(CONFIG_FILE, "r") as f:
-        config = json.load(f)
+    return _load_config(mtime_ns)
 
-    return ModelConfig(
-        type=config["type"],
-        model_id=config["model_id"],
-        api_key=config["api_key"],
-        api_base=config["api_base"],
-    )
 
+@lru_cache(maxsize=2)
+def _probe_container_engine(verify: bool) -> Optional[str]:
+    """
+    Look for an installed container engine, memoized for the process lifetime.
+
+    Args:
+        verify (bool): Also run "<engine> --version" to check that the binary works.
 
-def detect_container_engine() -> str:
+    Returns:
+        Optional[str]: Name of the available container engine, or None if none is found.
+    """
+    # Check for podman first (preferred), then docker as fallback
+    for engine in ("podman", "docker"):
+        # A PATH lookup is much cheaper than forking the engine
+        if shutil.which(engine) is None:
+            continue
+
+        if not verify:
+            return engine
+
+        try:
+            subprocess.run(
+                [engine, "--version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
+            return engine
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            continue
+
+    return None
+
+
+def detect_container_engine(verify: bool = False) -> str:
     """
     Detect which container engine is installed on the system.
     Prefers podman if both are available.
 
+    The engines are looked up on the PATH. The lookup runs once per process,
+    later calls reuse its result (including a failure).
+
+    Args:
+        verify (bool): Also run "<engine> --version" to check that the binary works.
+
     Returns:
         str: Name of the available container engine ("podman" or "docker")
 
     Raises:
         ContainerEngineNotFoundError: If neither podman nor docker is found
     """
-    # Check for podman first (preferred)
-    try:
-        subprocess.run(
-            ["podman", "--version"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True,
+    container_engine = _probe_container_engine(verify)
+
+    if container_engine is None:
+        raise ContainerEngineNotFoundError(
+            "No container engine found. Please install podman or docker."
         )
-        return "podman"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # Check for docker as fallback
-        try:
-            subprocess.run(
-                ["docker", "--version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True,
-            )
-            return "docker"
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            raise ContainerEngineNotFoundError(
-                "No container engine found. Please install podman or docker."
-            )
 
+    return container_engine
+
+
+def image_exists(container_engine: str) -> bool:
+    """
+    Check whether the container image has already been built.
+
+    Args:
+        container_engine (str): Container engine to query ("podman" or "docker")
 
-@app.command("init")
-@app.command("configure")
-def configure() -> None:
-    """Initialize or update configuration interactively."""
-    conf_set()
+    Returns:
+        bool: True if the engine knows an image named IMAGE_NAME.
+    """
+    result = subprocess.run(
+        [container_engine, "image", "inspect", IMAGE_NAME],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
 
 
+# init, configure and conf set all share the same implementation
+@app.command("init", help="Initialize or update configuration interactively.")
+@app.command("configure", help="Initialize or update configuration interactively.")
 @conf_app.command("set")
 def conf_set() -> None:
     """Set configuration values interactively and save to config file."""
@@ -164,7 +231,7 @@ def conf_show() -> None:
     try:
         config = read_config()
         # Hide API key in display
-        display_config = {**config}
+        display_config = asdict(config)
         if display_config.get("api_key"):
             display_config["api_key"] = "********"
         console.print_json(json.dumps(display_config))
@@ -194,7 +261,10 @@ def conf_delete() -> None:
 def build(
     container_engine: Optional[str] = typer.Option(
         None, "--engine", "-e", help="Container engine to use (docker|podman)"
-    )
+    ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Rebuild the image even if it already exists"
+    ),
 ) -> None:
     """Build the container image using Docker or Podman."""
     # Get the directory containing this script
@@ -209,8 +279,19 @@ def build(
             console.print(f"[red]{e}[/red]")
             return
 
-    console.print(f"Building container image using {container_engine}: {IMAGE_NAME}")
     try:
+        # The image tag carries ENV_VERSION, which is bumped whenever the files
+        # copied into the image change, so an existing image is up to date
+        if not force and image_exists(container_engine):
+            console.print(
+                f"[green]Container image {IMAGE_NAME} already exists. "
+                "Use --force to rebuild it.[/green]"
+            )
+            return
+
+        console.print(
+            f"Building container image using {container_engine}: {IMAGE_NAME}"
+        )
         subprocess.run(
             [container_engine, "build", "-t", IMAGE_NAME, build_path], check=True
         )
@@ -251,27 +332,31 @@ def run(
         console.print(f"[red]Error reading configuration file: {e}[/red]")
         return
 
-    # If no container engine specified, auto-detect
-    if not container_engine:
-        try:
-            container_engine = detect_container_engine()
-            console.print(f"Auto-detected container engine: {container_engine}")
-        except ContainerEngineNotFoundError as e:
-            console.print(f"[red]{e}[/red]")
-            return
-
     # Prepare volume mappings for data files
     volumes = []
     try:
+        # Drop repeated paths (keeping order) so a file is checked and mounted once
+        files = list(dict.fromkeys(files))
+        file_checks = check_files(files)
+        # Path.absolute() calls os.getcwd() on every use, resolve it only once
+        cwd = Path.cwd()
         for file_path in files:
-            if file_path.exists():
-                absolute_path = str(file_path.absolute())
-                file_dest_path = f"{SOURCE_FILES_DIR}/{file_path.name}"
-                volumes.append((absolute_path, file_dest_path))
-            else:
+            is_file = file_checks[file_path]
+            if is_file is None:
                 console.print(
                     f"[yellow]Warning: File {file_path} not found. Skipping.[/yellow]"
                 )
+                continue
+
+            if not is_file:
+                console.print(
+                    f"[yellow]Warning: {file_path} is not a file. Skipping.[/yellow]"
+                )
+                continue
+
+            absolute_path = str(file_path if file_path.is_absolute() else cwd / file_path)
+            file_dest_path = f"{SOURCE_FILES_DIR}/{file_path.name}"
+            volumes.append((absolute_path, file_dest_path))
     except Exception as e:
         console.print(f"[red]Error processing input files: {e}[/red]")
         return
@@ -280,6 +365,15 @@ def run(
         console.print("[yellow]No valid input files found.[/yellow]")
         return
 
+    # If no container engine specified, auto-detect
+    if not container_engine:
+        try:
+            container_engine = detect_container_engine()
+            console.print(f"Auto-detected container engine: {container_engine}")
+        except ContainerEngineNotFoundError as e:
+            console.print(f"[red]{e}[/red]")
+            return
+
     # Get the task from arguments or prompt user
     task_desc = task
     if not task_desc:
@@ -287,33 +381,45 @@ def run(
 
     # Run the command with a temporary directory for outputs
     try:
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        # The model settings are passed through an env file (created 0600 and
+        # kept out of the mounted directory) so the API key doesn't show up
+        # in the process list
+        with tempfile.TemporaryDirectory() as tmp_dir, tempfile.NamedTemporaryFile(
+            "w", prefix=f"{APP_NAME}-", suffix=".env", delete_on_close=False
+        ) as env_file:
+            env_vars = {
+                "MODEL_TYPE": config.type,
+                "MODEL_ID": config.model_id,
+                "MODEL_API_KEY": config.api_key,
+                "MODEL_API_BASE": config.api_base,
+            }
+            # Blank settings are left unset rather than passed as empty strings
+            env_file.write(
+                "".join(f"{key}={value}\n" for key, value in env_vars.items() if value)
+            )
+            env_file.close()
+
+            # Volume mappings for data files
+            volume_args = [
+                arg for src, dest in volumes for arg in ("-v", f"{src}:{dest}:ro")
+            ]
+
             cmd = [
                 container_engine,
                 "run",
-                "-it",
+                # stdin stays open for the followup questions, but a TTY is
+                # only allocated when there is one to attach to
+                "-it" if sys.stdin.isatty() else "-i",
                 "--rm",
-                "--env",
-                f"MODEL_TYPE={config['type']}",
-                "--env",
-                f"MODEL_ID={config['model_id']}",
-                "--env",
-                f"MODEL_API_KEY={config['api_key']}",
-                "--env",
-                f"MODEL_API_BASE={config['api_base']}",
+                "--env-file",
+                env_file.name,
                 "-v",
                 f"{tmp_dir}:{WORK_DIR}:rw",
+                *volume_args,
+                IMAGE_NAME,
+                task_desc,
             ]
 
-            # Add volume mappings for data files
-            for src, dest in volumes:
-                cmd.append("-v")
-                cmd.append(f"{src}:{dest}:ro")
-
-            # Add image name and task
-            cmd.append(IMAGE_NAME)
-            cmd.append(task_desc)
-
             # Run the container
             console.print("[blue]Starting analysis...[/blue]")
             subprocess.run(cmd)
@@ -7,7 +7,9 @@ SmolAnalyst Constants - Central location for application constants.
 # Application constants
 APP_NAME = "smolanalyst"
 ENV_NAME = "smolanalyst"
-ENV_VERSION = "0.1.1"
+# Container image version, bump it whenever a file copied into the image
+# (see Dockerfile) changes so that `smolanalyst build` rebuilds it
+ENV_VERSION = "0.1.2"
 
 # Container directories
 WORK_DIR = "/smolanalyst"
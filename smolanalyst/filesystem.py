@@ -8,10 +8,89 @@ and copying files between directories with appropriate permission handling.
 """
 
 import os
+import stat
+import errno
 import shutil
 import datetime
 from pathlib import Path
-from typing import Optional
+from collections import defaultdict
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+# Maximum number of bytes handed to a single os.copy_file_range call
+COPY_CHUNK_SIZE = 1 << 30
+
+# Errors meaning a path doesn't exist, the ones Path.exists() ignores
+MISSING_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.ELOOP)
+
+
+def _stat_is_file(file_path: Path) -> Optional[bool]:
+    """
+    Check whether a single path is a regular file, following symbolic links.
+
+    Args:
+        file_path (Path): Path to check.
+
+    Returns:
+        Optional[bool]: True if it is a regular file, False if it exists but is not
+        a regular file, None if it doesn't exist (including dangling or looping links).
+
+    Raises:
+        OSError: If the path can't be checked for another reason.
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except OSError as e:
+        if e.errno in MISSING_ERRNOS:
+            return None
+        raise
+
+    return stat.S_ISREG(file_stat.st_mode)
+
+
+def check_files(file_paths: List[Path]) -> Dict[Path, Optional[bool]]:
+    """
+    Check which of the given paths exist and are regular files.
+
+    Paths sharing a parent directory are resolved with a single directory scan
+    instead of one stat call per path. A path alone in its directory, one the
+    scan doesn't list, or one in a directory that can't be listed, is checked
+    with os.stat.
+
+    Args:
+        file_paths (List[Path]): Paths to check.
+
+    Returns:
+        Dict[Path, Optional[bool]]: For each path, True if it is a regular file,
+        False if it exists but is not a regular file, None if it doesn't exist.
+    """
+    by_parent = defaultdict(list)
+    for file_path in file_paths:
+        by_parent[file_path.parent].append(file_path)
+
+    result = {}
+    for parent, paths in by_parent.items():
+        if len(paths) == 1:
+            result[paths[0]] = _stat_is_file(paths[0])
+            continue
+
+        try:
+            with os.scandir(parent) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            # Missing, or searchable but not readable (execute without read
+            # permission), the stat fallback below handles both
+            entries = {}
+
+        for file_path in paths:
+            entry = entries.get(file_path.name)
+            if entry is None or entry.is_symlink():
+                # Names like ".." are never listed, and a link is resolved by a
+                # stat so that dangling or looping links count as missing
+                result[file_path] = _stat_is_file(file_path)
+            else:
+                result[file_path] = entry.is_file()
+
+    return result
 
 
 def set_full_permissions(directory: str) -> None:
@@ -29,22 +108,160 @@ def set_permissions_recursively(directory: str, mode: int) -> None:
     Raises:
         ValueError: If the directory doesn't exist.
     """
-    dir_path = Path(directory)
-
-    if not dir_path.exists():
+    if not os.path.exists(directory):
         raise ValueError(f"Directory does not exist: {directory}")
 
     try:
-        # Walk through all files and directories
-        for path in dir_path.glob("**/*"):
-            os.chmod(path, mode)
+        # Walk through all files and directories, plain names are yielded so
+        # no Path object or extra stat is needed per entry
+        if os.chmod in os.supports_dir_fd and hasattr(os, "fwalk"):
+            # Changing modes relative to an open directory fd resolves a single
+            # path component per entry instead of the whole path. Links are
+            # followed as before, CPython has no follow_symlinks=False support
+            # for chmod on Linux (it raises NotImplementedError)
+            for _, dir_names, file_names, dir_fd in os.fwalk(directory):
+                for name in dir_names:
+                    os.chmod(name, mode, dir_fd=dir_fd)
+                for name in file_names:
+                    os.chmod(name, mode, dir_fd=dir_fd)
+        else:
+            for root, dir_names, file_names in os.walk(directory):
+                for name in dir_names:
+                    os.chmod(os.path.join(root, name), mode)
+                for name in file_names:
+                    os.chmod(os.path.join(root, name), mode)
 
         # Also set permissions on the root directory
-        os.chmod(dir_path, mode)
+        os.chmod(directory, mode)
     except Exception as e:
         print(f"Warning: Failed to set permissions on {directory}: {e}")
 
 
+def scan_files(
+    directory: str, rel_dir: str = ""
+) -> Iterator[Tuple[os.DirEntry, str]]:
+    """
+    Recursively yield the files below a directory with their parent's relative path.
+
+    Uses os.scandir so that file types come from the cached directory entries
+    rather than from one stat call per path. Symbolic links are never followed
+    nor yielded: the scanned tree may be untrusted (written by the agent), and a
+    link could point anywhere on the host.
+
+    Args:
+        directory (str): Path to the directory to scan.
+        rel_dir (str): Path of the directory relative to the scan root.
+
+    Yields:
+        Tuple[os.DirEntry, str]: Each file entry with the relative path of its
+        directory ("" for the root).
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                sub_dir = f"{rel_dir}{os.sep}{entry.name}" if rel_dir else entry.name
+                yield from scan_files(entry.path, sub_dir)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry, rel_dir
+
+
+def _timestamped_name(directory: str, name: str, timestamp: str) -> str:
+    """
+    Build a file name that doesn't exist in a directory by appending a timestamp.
+
+    Args:
+        directory (str): Directory the file is created in.
+        name (str): The file name that already exists.
+        timestamp (str): Timestamp to append to the file stem.
+
+    Returns:
+        str: The first of stem_timestamp, stem_timestamp_1, ... that doesn't exist.
+    """
+    stem, suffix = os.path.splitext(name)
+    candidate = f"{stem}_{timestamp}{suffix}"
+    counter = 1
+    # lexists, the exclusive create also refuses names taken by dangling links
+    while os.path.lexists(f"{directory}{os.sep}{candidate}"):
+        candidate = f"{stem}_{timestamp}_{counter}{suffix}"
+        counter += 1
+
+    return candidate
+
+
+def _copy_contents(src: BinaryIO, dst: BinaryIO) -> None:
+    """
+    Copy the contents of an open file into another, in the kernel when possible.
+
+    os.copy_file_range (Linux) copies without moving the data through user space
+    and can use reflinks on filesystems supporting them. Whatever it didn't copy,
+    e.g. because the platform or filesystem doesn't support it, is copied with
+    shutil.copyfileobj from the current offsets.
+
+    Args:
+        src (BinaryIO): File to read from.
+        dst (BinaryIO): File to write to.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src.fileno(), dst.fileno(), COPY_CHUNK_SIZE):
+                pass
+        except OSError:
+            pass
+
+    shutil.copyfileobj(src, dst)
+
+
+def _link_or_copy(source_file: os.DirEntry, dest_file: str, file_mode: int) -> None:
+    """
+    Hard link a file to its destination when possible, falling back to a copy,
+    and set the destination permissions.
+
+    A link avoids rewriting the file contents when both paths are on the same
+    filesystem. Only files owned by the current user are linked so that the
+    destination permissions can still be changed afterwards. The destination is
+    created exclusively in both cases, so an existing file is never overwritten.
+    Symbolic links are never followed, neither on the source nor when setting
+    the destination permissions.
+
+    Args:
+        source_file (os.DirEntry): The file to copy, a regular file (not a link).
+        dest_file (str): Destination path.
+        file_mode (int): Permission mode to set on the destination.
+
+    Raises:
+        FileExistsError: If the destination already exists.
+    """
+    source_stat = source_file.stat(follow_symlinks=False)
+
+    if hasattr(os, "getuid") and source_stat.st_uid == os.getuid():
+        try:
+            os.link(source_file, dest_file, follow_symlinks=False)
+        except FileExistsError:
+            raise
+        except OSError:
+            # Different filesystems or no hard link support
+            pass
+        else:
+            # Change the mode through a descriptor opened without following links
+            fd = os.open(dest_file, os.O_RDONLY | os.O_NOFOLLOW)
+            try:
+                os.fchmod(fd, file_mode)
+            finally:
+                os.close(fd)
+            return
+
+    # Contents only, the metadata copied by shutil.copy2 is not needed here
+    src_fd = os.open(source_file, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    with open(src_fd, "rb") as src, open(dest_file, "xb") as dst:
+        _copy_contents(src, dst)
+
+        # The exclusive create never follows links, chmod the file just created
+        if hasattr(os, "fchmod"):
+            os.fchmod(dst.fileno(), file_mode)
+        else:
+            os.chmod(dest_file, file_mode)
+
+
 def copy_from_source(
     source_dir: str,
     target_dir: Optional[str] = None,
@@ -56,6 +273,12 @@ def copy_from_source(
     working directory), preserving the directory structure. Avoids overwriting existing
     files by appending a timestamp to the filename. Sets appropriate permissions on copied files.
 
+    Files owned by the current user are hard linked rather than copied when both
+    directories are on the same filesystem: the destination then shares its inode with
+    the source, so it keeps the source modification time, and setting file_mode also
+    changes the mode of the source file. Other files are copied by contents only, with a
+    new modification time. Symbolic links in the source directory are skipped.
+
     Args:
         source_dir (str): Path to the source directory.
         target_dir (Optional[str]): Path to the target directory. If None, uses current working directory.
@@ -77,32 +300,45 @@ def copy_from_source(
     target_path.mkdir(parents=True, exist_ok=True)
     os.chmod(target_path, dir_mode)
 
-    # Walk through all files recursively with pathlib
-    for source_file in source_path.glob("**/*"):
-        # Skip directories, only process files
-        if not source_file.is_file():
-            continue
+    # Computed once per copy, a counter keeps colliding names unique
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Get relative path from source directory
-        rel_path = source_file.relative_to(source_path)
-        dest_file = target_path / rel_path
+    # Destination paths are built with plain string joins, and each
+    # destination directory is resolved and checked once
+    target = str(target_path)
+    dest_dirs = {"": target}
 
-        # Create parent directories if needed
-        if not dest_file.parent.exists():
-            dest_file.parent.mkdir(parents=True, exist_ok=True)
-            os.chmod(dest_file.parent, dir_mode)
+    # Report lines are collected and written at once rather than per file
+    created = []
 
-        # If file exists, append timestamp to the filename
-        if dest_file.exists():
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            dest_file = dest_file.with_name(
-                f"{dest_file.stem}_{timestamp}{dest_file.suffix}"
-            )
+    try:
+        # Walk through all files recursively
+        for source_file, rel_dir in scan_files(source_dir):
+            dest_dir = dest_dirs.get(rel_dir)
 
-        # Copy the file
-        shutil.copy2(source_file, dest_file)
+            # Create parent directories if needed
+            if dest_dir is None:
+                dest_dir = f"{target}{os.sep}{rel_dir}"
+                if not os.path.exists(dest_dir):
+                    os.makedirs(dest_dir, exist_ok=True)
+                    os.chmod(dest_dir, dir_mode)
+                dest_dirs[rel_dir] = dest_dir
 
-        # Set appropriate permissions on the copied file
-        os.chmod(dest_file, file_mode)
+            # Copy the file, if it exists append timestamp to the filename.
+            # Existence is detected by the exclusive create itself rather than
+            # by checking every destination beforehand
+            dest_name = source_file.name
+            dest_file = f"{dest_dir}{os.sep}{dest_name}"
+            try:
+                _link_or_copy(source_file, dest_file, file_mode)
+            except FileExistsError:
+                dest_name = _timestamped_name(dest_dir, dest_name, timestamp)
+                dest_file = f"{dest_dir}{os.sep}{dest_name}"
+                _link_or_copy(source_file, dest_file, file_mode)
 
-        print(f"Created: {dest_file.relative_to(target_path)}")
+            rel_file = f"{rel_dir}{os.sep}{dest_name}" if rel_dir else dest_name
+            created.append(f"Created: {rel_file}")
+    finally:
+        # Also report what was copied if the copy stops midway
+        if created:
+            print("\n".join(created))
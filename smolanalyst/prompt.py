@@ -1,10 +1,4 @@
-from string import Template
-
-EXTRA_INSTRUCTIONS = """
-Task: $task
-
----
-
+GUIDELINES = """
 ## Guidelines for Data Analysis
 
 ### Data Source Limitations
@@ -23,23 +17,28 @@ Task: $task
 - **Missing/Inadequate Data**: Clearly state the issue and terminate analysis if suitable data cannot be found
 """.strip()
 
-EXTRA_INSTRUCTIONS_WITH_SOURCE_FILES = f"""
-{EXTRA_INSTRUCTIONS}
-
-### Available Source Files:
-$files
-""".strip()
-
 
 class SmolanalystPrompt:
     def __init__(self, task: str, files: list[str] = []):
         self.task = task
         self.files = files
+        # Joined once so that re-rendering the prompt doesn't rebuild the list
+        self.files_block = "- " + "\n- ".join(files) if files else ""
+        # Rendered on first use, then reused by later str() calls
+        self._rendered = None
 
     def __str__(self):
-        if len(self.files) == 0:
-            return Template(EXTRA_INSTRUCTIONS).substitute(task=self.task)
+        if self._rendered is None:
+            self._rendered = self._render()
+
+        return self._rendered
+
+    def _render(self) -> str:
+        # Invariant content comes first and the task last, so consecutive
+        # prompts share the longest possible prefix for LLM prompt caching
+        prompt = GUIDELINES
+
+        if len(self.files) > 0:
+            prompt = f"{prompt}\n\n### Available Source Files:\n{self.files_block}"
 
-        return Template(EXTRA_INSTRUCTIONS_WITH_SOURCE_FILES).substitute(
-            task=self.task, files="\n".join("- " + file for file in self.files)
-        )
+        return f"{prompt}\n\n---\n\nTask: {self.task}"
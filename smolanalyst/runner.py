@@ -11,16 +11,17 @@ the bridge between the CLI interface and the actual analysis execution.
 import os
 import sys
 import stat
-from typing import List, Optional, Union
-from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Union
 
 # Third-party imports
-from smolagents import CodeAgent, LogLevel, HfApiModel, LiteLLMModel
+# smolagents is heavy to import, so it is only loaded once a task is actually run
+if TYPE_CHECKING:
+    from smolagents import HfApiModel, LiteLLMModel
 
 # Internal imports
 # The script runs inside the image so it must not be prepended with the package name
 from prompt import SmolanalystPrompt
-from filesystem import set_full_permissions
+from filesystem import scan_files, set_full_permissions
 from constants import WORK_DIR, SOURCE_FILES_DIR, ADDITIONAL_AUTHORIZED_IMPORTS
 
 # Environment variables for model configuration
@@ -29,8 +30,13 @@ MODEL_TYPE = os.getenv("MODEL_TYPE")
 MODEL_API_KEY = os.getenv("MODEL_API_KEY")
 MODEL_API_BASE = os.getenv("MODEL_API_BASE")
 
+# Set matplotlib backend to Agg for headless environments. Done through the
+# environment so matplotlib picks it up on first import without probing GUI
+# backends, and doesn't need to be imported until the agent uses it
+os.environ["MPLBACKEND"] = "Agg"
+
 # Type alias for model types
-ModelType = Union[HfApiModel, LiteLLMModel]
+ModelType = Union["HfApiModel", "LiteLLMModel"]
 
 
 def _build_model() -> Optional[ModelType]:
@@ -43,6 +49,8 @@ def _build_model() -> Optional[ModelType]:
     if not MODEL_TYPE or not MODEL_ID:
         return None
 
+    from smolagents import HfApiModel, LiteLLMModel
+
     if MODEL_TYPE == "hfapi":
         return HfApiModel(model_id=MODEL_ID, token=MODEL_API_KEY)
     elif MODEL_TYPE == "litellm":
@@ -89,21 +97,15 @@ def list_source_files(directory: str) -> List[str]:
     Returns:
         List[str]: List of absolute paths to all files found.
     """
-    file_list = []
-    dir_path = Path(directory)
-
-    if not dir_path.exists():
-        return []
+    # Entries of a directory scanned through its absolute path are absolute
+    # already, so there is no per-file absolute() call (and getcwd syscall)
+    root = os.path.abspath(directory)
 
     try:
-        for path in dir_path.rglob("*"):
-            if path.is_file():
-                file_list.append(str(path.absolute()))
+        return [entry.path for entry, _ in scan_files(root)]
     except Exception:
         return []
 
-    return file_list
-
 
 def run(task: str) -> None:
     """
@@ -112,17 +114,14 @@ def run(task: str) -> None:
     Args:
         task (str): Description of the analysis task to perform.
     """
-    # Set matplotlib backend to Agg for headless environments
-    import matplotlib
+    from smolagents import CodeAgent, LogLevel
 
-    matplotlib.use("Agg")
+    # List files from the source directory
+    files = list_source_files(SOURCE_FILES_DIR)
 
     # Build model according to environment variables
     model = build_model()
 
-    # List files from the source directory
-    files = list_source_files(SOURCE_FILES_DIR)
-
     # Create code agent with appropriate permissions
     agent = CodeAgent(
         model=model,